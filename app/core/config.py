@@ -18,6 +18,9 @@ class Settings(BaseSettings):
 
     # 数据库配置
     database_url: str
+    db_pool_minsize: int = 10  # 连接池最小连接数（启动时预热）
+    db_pool_maxsize: int = 40  # 连接池最大连接数
+    db_pool_recycle: int = 300  # 空闲连接回收时间（秒）
 
     # 应用配置
     app_name: str = "FastAPI + TortoiseORM Demo"
@@ -7,7 +7,7 @@ from app.core.config import settings
 from app.core.exceptions import setup_exception_handlers
 from app.core.logging import log
 from app.core.middleware import setup_middleware
-from app.db.config import init_db, close_db
+from app.db.config import init_db, close_db, warmup_db
 from app.routers import api_router
 
 
@@ -21,6 +21,7 @@ async def lifespan(app: FastAPI):
 
     # 初始化数据库连接
     await init_db()
+    await warmup_db()
     log.info("✅ 数据库连接已建立")
 
     # 这里可以添加其他启动时的初始化操作
@@ -1,7 +1,9 @@
+import asyncio
 from pathlib import Path
 import pkgutil
 
-from tortoise import Tortoise
+from tortoise import Tortoise, connections
+from tortoise.backends.base.config_generator import expand_db_url
 
 from app.core.config import settings
 
@@ -30,10 +32,27 @@ def _discover_model_modules() -> list[str]:
     return modules
 
 
+def _build_connection_config() -> dict:
+    """
+    根据 database_url 生成连接配置，并设置连接池参数
+
+    Returns:
+        Tortoise 连接配置（engine + credentials）
+    """
+    config = expand_db_url(settings.database_url)
+    if "sqlite" not in config["engine"]:
+        config["credentials"].update(
+            minsize=settings.db_pool_minsize,
+            maxsize=settings.db_pool_maxsize,
+            pool_recycle=settings.db_pool_recycle,
+        )
+    return config
+
+
 # 数据库配置
 TORTOISE_ORM = {
     "connections": {
-        "default": settings.database_url
+        "default": _build_connection_config()
     },
     "apps": {
         "models": {
@@ -53,6 +72,16 @@ async def init_db():
     #     await Tortoise.generate_schemas()
 
 
+async def warmup_db():
+    """
+    预热连接池
+
+    并发执行 minsize 次 SELECT 1，确保连接池在首个请求到达前已建立好连接
+    """
+    conn = connections.get("default")
+    await asyncio.gather(*(conn.execute_query("SELECT 1") for _ in range(settings.db_pool_minsize)))
+
+
 async def close_db():
     """关闭数据库连接"""
     await Tortoise.close_connections()
@@ -1,9 +1,10 @@
 import sys
 from pathlib import Path
 
-# 确保从项目根目录导入模块
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+# 确保从项目根目录导入模块（已在 sys.path 中时不重复插入）
+project_root = str(Path(__file__).resolve().parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 import uvicorn
 from app.core.events import create_app
@@ -23,6 +23,7 @@ class ActivationCode(BaseModel):
     class Meta:
         table = "activation_codes"
         ordering = ["-created_at"]
+        indexes = [("type", "status")]
 
     @property
     def type_enum(self) -> ActivationTypeEnum:
@@ -2,7 +2,7 @@
 激活码仓储类
 封装激活码相关的所有数据访问操作
 """
-from typing import Optional, List
+from typing import Optional, List, Set
 from datetime import datetime
 
 from app.repositories.base import BaseRepository
@@ -34,13 +34,32 @@ class ActivationCodeRepository(BaseRepository[ActivationCode]):
         """
         return await self.get_or_none(activation_code=code)
 
+    async def find_distributed_for_update(self, code: str) -> Optional[ActivationCode]:
+        """
+        查询并锁定已分发的激活码（SELECT ... FOR UPDATE SKIP LOCKED）
+
+        需在事务内调用；被其他事务锁定的行会被跳过，避免并发注册时互相等待
+
+        Args:
+            code: 激活码字符串
+
+        Returns:
+            激活码实例，如果不存在、状态不是已分发或已被锁定则返回 None
+        """
+        return await self.model.filter(
+            activation_code=code,
+            status=ActivationCodeStatusEnum.DISTRIBUTED.code
+        ).select_for_update(skip_locked=True).first()
+
     async def find_unused_codes(
         self,
         type_code: int,
         limit: int
     ) -> List[ActivationCode]:
         """
-        查询未使用的激活码
+        查询并锁定未使用的激活码（SELECT ... FOR UPDATE SKIP LOCKED）
+
+        需在事务内调用；被其他事务锁定的行会被跳过，并发派发时不会拿到同一批激活码
 
         Args:
             type_code: 激活码类型
@@ -52,7 +71,7 @@ class ActivationCodeRepository(BaseRepository[ActivationCode]):
         return await self.model.filter(
             type=type_code,
             status=ActivationCodeStatusEnum.UNUSED.code
-        ).order_by("-created_at").limit(limit).all()
+        ).order_by("-created_at").limit(limit).select_for_update(skip_locked=True).all()
 
     async def find_distributed_codes(
         self,
@@ -81,17 +100,20 @@ class ActivationCodeRepository(BaseRepository[ActivationCode]):
 
         return await query.all()
 
-    async def code_exists(self, code: str) -> bool:
+    async def find_existing_codes(self, codes: List[str]) -> Set[str]:
         """
-        检查激活码是否存在
+        批量检查激活码是否存在
 
         Args:
-            code: 激活码字符串
+            codes: 激活码字符串列表
 
         Returns:
-            是否存在
+            已存在的激活码集合
         """
-        return await self.exists(activation_code=code)
+        if not codes:
+            return set()
+        rows = await self.model.filter(activation_code__in=codes).values_list("activation_code", flat=True)
+        return set(rows)
 
     async def count_by_status(
         self,
@@ -198,20 +220,34 @@ class ActivationCodeRepository(BaseRepository[ActivationCode]):
             activated_at=activated_at
         )
 
-    async def distribute_activation_code(self, code: ActivationCode) -> ActivationCode:
+    async def distribute_activation_codes(self, codes: List[ActivationCode]) -> int:
         """
-        分发激活码
+        批量分发激活码（单条 UPDATE），并同步更新传入实例的字段
+
+        UPDATE 附带未使用状态条件，已被其他请求分发的激活码不会被重复分发
 
         Args:
-            code: 激活码实例
+            codes: 激活码实例列表
 
         Returns:
-            更新后的激活码实例
+            更新的记录数量
         """
-        code.distributed_at = get_utc_now()
-        code.status = ActivationCodeStatusEnum.DISTRIBUTED.code
-        await code.save()
-        return code
+        if not codes:
+            return 0
+
+        distributed_at = get_utc_now()
+        status = ActivationCodeStatusEnum.DISTRIBUTED.code
+        updated = await self.model.filter(
+            id__in=[code.id for code in codes],
+            status=ActivationCodeStatusEnum.UNUSED.code
+        ).update(
+            distributed_at=distributed_at,
+            status=status
+        )
+        for code in codes:
+            code.distributed_at = distributed_at
+            code.status = status
+        return updated
 
     async def activate_activation_code(
         self,
@@ -234,7 +270,7 @@ class ActivationCodeRepository(BaseRepository[ActivationCode]):
         code.activated_at = activated_at
         code.expire_time = expire_time
         code.status = ActivationCodeStatusEnum.ACTIVATED.code
-        await code.save()
+        await code.save(update_fields=["activated_at", "expire_time", "status", "updated_at"])
         return code
 
     async def invalidate_activation_code(self, code: ActivationCode) -> ActivationCode:
@@ -67,18 +67,6 @@ class UserRepository(BaseRepository[User]):
         """
         return await self.get_or_none(activation_code=activation_code)
 
-    async def username_exists(self, username: str) -> bool:
-        """
-        检查用户名是否存在
-
-        Args:
-            username: 用户名
-
-        Returns:
-            是否存在
-        """
-        return await self.exists(username=username)
-
     async def phone_exists(self, phone: str) -> bool:
         """
         检查手机号是否存在
@@ -21,28 +21,18 @@ class MonitorConfigRepository(BaseRepository[MonitorConfig]):
         """初始化监控配置仓储"""
         super().__init__(MonitorConfig)
 
-    async def find_by_id(
-        self,
-        config_id: int,
-        user_id: int,
-        include_deleted: bool = False
-    ) -> Optional[MonitorConfig]:
+    async def config_exists(self, config_id: int, user_id: int) -> bool:
         """
-        根据 ID 查询监控配置
+        检查监控配置是否存在（未删除）
 
         Args:
             config_id: 配置 ID
             user_id: 用户 ID
-            include_deleted: 是否包含已删除的记录
 
         Returns:
-            监控配置实例，如果不存在则返回 None
+            是否存在
         """
-        filters = {"id": config_id, "user_id": user_id}
-        if not include_deleted:
-            filters["deleted_at__isnull"] = True
-
-        return await self.get_or_none(**filters)
+        return await self.exists(id=config_id, user_id=user_id, deleted_at__isnull=True)
 
     def find_with_filters(
         self,
@@ -115,71 +105,62 @@ class MonitorConfigRepository(BaseRepository[MonitorConfig]):
             account_avatar=account_avatar
         )
 
-    async def update_monitor_config(
+    async def update_target_url(
         self,
-        config: MonitorConfig,
-        target_url: Optional[str] = None,
-        target_external_id: Optional[str] = None,
-        account_name: Optional[str] = None,
-        account_avatar: Optional[str] = None
-    ) -> MonitorConfig:
+        config_id: int,
+        user_id: int,
+        target_url: str
+    ) -> int:
         """
-        更新监控配置
+        更新监控目标链接（单条条件 UPDATE，无需先查询）
 
         Args:
-            config: 监控配置实例
+            config_id: 配置 ID
+            user_id: 用户 ID
             target_url: 监控目标链接
-            target_external_id: 平台唯一 ID
-            account_name: 账号名称
-            account_avatar: 账号头像 URL
 
         Returns:
-            更新后的监控配置实例
+            受影响的行数，0 表示配置不存在
         """
-        if target_url is not None:
-            config.target_url = target_url
-        if target_external_id is not None:
-            config.target_external_id = target_external_id
-        if account_name is not None:
-            config.account_name = account_name
-        if account_avatar is not None:
-            config.account_avatar = account_avatar
-
-        await config.save()
-        return config
+        return await self.model.filter(
+            id=config_id, user_id=user_id, deleted_at__isnull=True
+        ).update(target_url=target_url)
 
     async def toggle_monitor_status(
         self,
-        config: MonitorConfig,
+        config_id: int,
+        user_id: int,
         is_active: int
-    ) -> MonitorConfig:
+    ) -> int:
         """
-        切换监控状态
+        切换监控状态（单条条件 UPDATE，无需先查询）
 
         Args:
-            config: 监控配置实例
+            config_id: 配置 ID
+            user_id: 用户 ID
             is_active: 是否启用
 
         Returns:
-            更新后的监控配置实例
+            受影响的行数，0 表示配置不存在
         """
-        config.is_active = is_active
-        await config.save()
-        return config
+        return await self.model.filter(
+            id=config_id, user_id=user_id, deleted_at__isnull=True
+        ).update(is_active=is_active)
 
-    async def soft_delete_config(self, config: MonitorConfig) -> MonitorConfig:
+    async def soft_delete_by_id(self, config_id: int, user_id: int) -> int:
         """
-        软删除监控配置
+        软删除监控配置（单条条件 UPDATE，无需先查询）
 
         Args:
-            config: 监控配置实例
+            config_id: 配置 ID
+            user_id: 用户 ID
 
         Returns:
-            更新后的监控配置实例
+            受影响的行数，0 表示配置不存在
         """
-        config.deleted_at = get_utc_now()
-        await config.save()
-        return config
+        return await self.model.filter(
+            id=config_id, user_id=user_id, deleted_at__isnull=True
+        ).update(deleted_at=get_utc_now())
 
     async def update_last_run_info(
         self,
@@ -25,23 +25,28 @@ class MonitorDailyStatsRepository(BaseRepository[MonitorDailyStats]):
         config_id: int,
         start_date: date,
         end_date: date
-    ) -> List[MonitorDailyStats]:
+    ) -> List[Dict[str, Any]]:
         """
         根据配置 ID 和日期范围查询每日数据
 
+        直接返回字典行（.values()），跳过 ORM 对象构建，供响应模型批量校验
+
         Args:
             config_id: 配置 ID
             start_date: 开始日期
             end_date: 结束日期
 
         Returns:
-            每日数据列表，按日期升序排列
+            每日数据字典列表，按日期升序排列
         """
         return await self.model.filter(
             config_id=config_id,
             stat_date__gte=start_date,
             stat_date__lte=end_date
-        ).order_by("stat_date").all()
+        ).order_by("stat_date").values(
+            "id", "config_id", "stat_date", "follower_count", "liked_count",
+            "view_count", "content_count", "extra_data", "created_at"
+        )
 
     async def find_by_config_and_date(
         self,
@@ -44,7 +44,7 @@ async def get_monitor_config_list(
     return await paginated_response(query, params)
 
 
-@router.post("/config/update", response_model=ApiResponse[MonitorConfigResponse], summary="修改监控配置")
+@router.post("/config/update", response_model=ApiResponse[bool], summary="修改监控配置")
 async def update_monitor_config(
     request: MonitorConfigUpdateRequest,
     user_id: int = Depends(get_current_user_id)
@@ -59,7 +59,7 @@ async def update_monitor_config(
     return success_response(data=result)
 
 
-@router.post("/config/toggle", response_model=ApiResponse[MonitorConfigResponse], summary="切换监控状态")
+@router.post("/config/toggle", response_model=ApiResponse[bool], summary="切换监控状态")
 async def toggle_monitor_config(
     request: MonitorConfigToggleRequest,
     user_id: int = Depends(get_current_user_id)
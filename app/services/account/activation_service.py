@@ -6,6 +6,7 @@ from app.core.exceptions import BusinessException
 from app.core.logging import log
 from app.enums.account.activation_type import ActivationTypeEnum
 from app.enums.account.activation_status import ActivationCodeStatusEnum
+from app.models.account.activation_code import ActivationCode
 from app.repositories.account.activation_repository import activation_repository
 from app.schemas.account.activation import (
     ActivationCodeBatchCreateRequest,
@@ -16,23 +17,32 @@ from app.schemas.account.activation import (
     ActivationCodeResponse, ActivationCodeQueryRequest
 )
 from app.util.activation_code_generator import code_generator
+from app.util.transaction import transactional
 
 
 class ActivationCodeService:
     """激活码服务类"""
 
-    async def _generate_unique_code(self) -> str:
+    async def _generate_unique_codes(self, count: int) -> List[str]:
         """
-        生成唯一的激活码
+        批量生成唯一的激活码
+
+        每轮只用一次 IN 查询剔除数据库中已存在的激活码，冲突的部分在下一轮补足
+
+        Args:
+            count: 需要生成的数量
 
         Returns:
-            唯一的激活码字符串
+            唯一的激活码字符串列表
         """
-        while True:
-            code = code_generator.generate()
-            if not await activation_repository.code_exists(code):
-                return code
-
+        codes = set()
+        while len(codes) < count:
+            candidates = {code_generator.generate() for _ in range(count - len(codes))} - codes
+            existing = await activation_repository.find_existing_codes(list(candidates))
+            codes |= candidates - existing
+        return list(codes)
+
+    @transactional
     async def init_activation_codes(self, request: ActivationCodeBatchCreateRequest) -> ActivationCodeBatchResponse:
         """
         批量初始化激活码数据
@@ -43,7 +53,7 @@ class ActivationCodeService:
         Returns:
             批量创建响应
         """
-        log.info(f"开始批量生成激活码，共{len(request.items)}种类型")
+        log.info("开始批量生成激活码，共{}种类型", len(request.items))
 
         results = []
         total_count = 0
@@ -53,20 +63,17 @@ class ActivationCodeService:
             type_enum = ActivationTypeEnum.from_code(item.type)
             type_name = type_enum.desc
 
-            log.info(f"生成{type_name}激活码，数量：{item.count}")
-
-            activation_codes = []
+            log.info("生成{}激活码，数量：{}", type_name, item.count)
 
-            for i in range(item.count):
-                code = await self._generate_unique_code()
-                await activation_repository.create_activation_code(
-                    activation_code=code,
-                    type_code=item.type,
-                    status=ActivationCodeStatusEnum.UNUSED.code,
-                    expire_time=None,
-                    activated_at=None
-                )
-                activation_codes.append(code)
+            activation_codes = await self._generate_unique_codes(item.count)
+            await activation_repository.bulk_create([
+                {
+                    "activation_code": code,
+                    "type": item.type,
+                    "status": ActivationCodeStatusEnum.UNUSED.code
+                }
+                for code in activation_codes
+            ])
 
             # 构建响应
             type_result = ActivationCodeTypeResult(
@@ -79,9 +86,9 @@ class ActivationCodeService:
             total_count += len(activation_codes)
             summary[type_name] = len(activation_codes)
 
-            log.info(f"成功生成{len(activation_codes)}个{type_name}激活码")
+            log.info("成功生成{}个{}激活码", len(activation_codes), type_name)
 
-        log.info(f"批量生成完成，总计{total_count}个激活码")
+        log.info("批量生成完成，总计{}个激活码", total_count)
 
         return ActivationCodeBatchResponse(
             results=results,
@@ -89,6 +96,7 @@ class ActivationCodeService:
             summary=summary
         )
 
+    @transactional
     async def distribute_activation_codes(self, request: ActivationCodeGetRequest) -> List[str]:
         """
         派发激活码
@@ -100,9 +108,9 @@ class ActivationCodeService:
             激活码字符串列表
 
         Raises:
-            BusinessException: 激活码数量不足
+            BusinessException: 激活码数量不足或已被并发派发
         """
-        log.info(f"派发激活码，类型：{request.type}，数量：{request.count}")
+        log.info("派发激活码，类型：{}，数量：{}", request.type, request.count)
 
         codes = await activation_repository.find_unused_codes(
             type_code=request.type,
@@ -114,38 +122,48 @@ class ActivationCodeService:
             raise BusinessException(
                 message=f"{type_enum.desc}可用激活码不足，需要{request.count}个，实际只有{len(codes)}个")
 
-        activation_codes = []
-        for code in codes:
-            await activation_repository.distribute_activation_code(code)
-            activation_codes.append(code.activation_code)
+        updated = await activation_repository.distribute_activation_codes(codes)
+        # 部分激活码已被并发请求分发，抛出异常使事务回滚
+        if updated != len(codes):
+            raise BusinessException(message="激活码正在被派发，请稍后重试")
+
+        activation_codes = [code.activation_code for code in codes]
 
-        log.info(f"成功派发{len(activation_codes)}个激活码")
+        log.info("成功派发{}个激活码", len(activation_codes))
         return activation_codes
 
-    async def get_distributed_activation_code(self, activation_code: str):
+    async def claim_activation_code(self, activation_code: str) -> ActivationCode:
         """
-        查询已分发的激活码
+        锁定并激活已分发的激活码（注册专用，需在事务内调用）
+
+        通过 SELECT ... FOR UPDATE SKIP LOCKED 锁定激活码行，
+        并发注册同一激活码时只有一个事务能拿到该行，其余直接失败而不是等待
 
         Args:
             activation_code: 激活码字符串
 
         Returns:
-            激活码实例
+            激活后的激活码实例
 
         Raises:
-            BusinessException: 激活码不存在或状态不正确
+            BusinessException: 激活码不存在、状态不正确或正被其他注册占用
         """
-        log.info(f"查询已分发激活码：{activation_code}")
+        log.info("锁定并激活激活码：{}", activation_code)
 
-        code = await activation_repository.find_by_code(activation_code)
+        code = await activation_repository.find_distributed_for_update(activation_code)
 
         if not code:
-            raise BusinessException(message="激活码不存在")
-
-        if code.status != ActivationCodeStatusEnum.DISTRIBUTED.code:
+            # 未锁到行时用不加锁的一致性读区分原因：不存在、状态不对，或已被其他注册事务锁定
+            current = await activation_repository.find_by_code(activation_code)
+            if not current:
+                raise BusinessException(message="激活码不存在")
+            if current.status == ActivationCodeStatusEnum.DISTRIBUTED.code:
+                raise BusinessException(message="激活码正在被使用，请稍后重试")
             raise BusinessException(message="激活码状态不正确，必须是已分发状态")
 
-        log.info(f"成功查询已分发激活码：{activation_code}")
+        await activation_repository.activate_activation_code(code, settings.activation_grace_hours)
+
+        log.info("激活码{}激活成功", activation_code)
         return code
 
     async def activate_activation_code(self, activation_code: str) -> ActivationCodeResponse:
@@ -161,7 +179,7 @@ class ActivationCodeService:
         Raises:
             BusinessException: 激活码不存在或状态不允许激活
         """
-        log.info(f"激活激活码：{activation_code}")
+        log.info("激活激活码：{}", activation_code)
 
         code = await activation_repository.find_by_code(activation_code)
 
@@ -179,7 +197,7 @@ class ActivationCodeService:
 
         await activation_repository.activate_activation_code(code, settings.activation_grace_hours)
 
-        log.info(f"激活码{activation_code}激活成功")
+        log.info("激活码{}激活成功", activation_code)
         return ActivationCodeResponse.model_validate(code, from_attributes=True)
 
     async def invalidate_activation_code(self, request: ActivationCodeInvalidateRequest) -> bool:
@@ -195,7 +213,7 @@ class ActivationCodeService:
         Raises:
             BusinessException: 激活码不存在或状态不允许作废
         """
-        log.info(f"作废激活码：{request.activation_code}")
+        log.info("作废激活码：{}", request.activation_code)
 
         code = await activation_repository.find_by_code(request.activation_code)
 
@@ -210,7 +228,7 @@ class ActivationCodeService:
 
         await activation_repository.invalidate_activation_code(code)
 
-        log.info(f"激活码{request.activation_code}已作废")
+        log.info("激活码{}已作废", request.activation_code)
         return True
 
     async def get_activation_code_by_code(self, activation_code: str) -> ActivationCodeResponse:
@@ -6,7 +6,7 @@ from app.models.account.user import User
 from app.repositories.account.user_repository import user_repository
 from app.repositories.account.activation_repository import activation_repository
 from app.util.jwt import jwt_manager
-from app.util.password import verify_password, hash_password
+from app.util.password import averify_password, ahash_password
 
 
 class AuthService:
@@ -31,7 +31,7 @@ class AuthService:
             raise BusinessException(message="用户名或密码错误", code=401)
 
         # 验证密码
-        if not verify_password(password, user.password):
+        if not await averify_password(password, user.password):
             raise BusinessException(message="用户名或密码错误", code=401)
 
         # 检查激活码是否过期
@@ -64,7 +64,7 @@ class AuthService:
         token_info = jwt_manager.create_access_token(user.id)
         access_token = token_info["access_token"]
 
-        log.info(f"用户 {username} 登录成功")
+        log.info("用户 {} 登录成功", username)
         return access_token
 
     async def logout_user(self, token: str) -> None:
@@ -88,10 +88,10 @@ class AuthService:
             是否修改成功
         """
         # 更新密码（schema已验证复杂度）
-        user.password = hash_password(new_password)
+        user.password = await ahash_password(new_password)
         await user_repository.update(user)
 
-        log.info(f"用户 {user.username} 修改密码成功")
+        log.info("用户 {} 修改密码成功", user.username)
         return True
 
 
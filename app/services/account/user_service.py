@@ -1,47 +1,65 @@
+import asyncio
 from typing import Optional, List
 
+from tortoise.exceptions import IntegrityError
+
 from app.core.exceptions import BusinessException
 from app.core.logging import log
+from app.models.account.user import User
 from app.repositories.account.user_repository import user_repository
 from app.schemas.account.user import UserRegisterRequest, UserUpdateRequest, UserResponse, UserQueryRequest
 from app.services.account.activation_service import activation_service
 from app.util.transaction import transactional
-from app.util.password import hash_password
+from app.util.password import ahash_password
 
 
 class UserService:
     """用户服务类"""
 
-    @transactional
     async def register_user(self, user_data: UserRegisterRequest) -> UserResponse:
         """
-        用户注册（使用事务装饰器）
+        用户注册
 
-        整个方法在事务中执行，确保用户创建和激活码激活的原子性
+        密码哈希在事务外完成，避免 bcrypt 计算期间持有激活码行锁和数据库连接
         """
-        log.info(f"用户注册：{user_data.username}")
+        log.info("用户注册：{}", user_data.username)
 
-        # 1. 验证激活码是否为已分发状态
-        await activation_service.get_distributed_activation_code(user_data.activation_code)
+        hashed_password = await ahash_password(user_data.password)
+        return await self._register_user(user_data, hashed_password)
 
-        # 2. 检查用户名唯一性
-        is_conflict = await self.check_username_unique(user_data.username)
-        if is_conflict:
-            raise BusinessException(message="用户名已存在", code=400)
+    @transactional
+    async def _register_user(self, user_data: UserRegisterRequest, hashed_password: str) -> UserResponse:
+        """
+        用户注册事务部分（使用事务装饰器）
 
-        # 3. 创建用户（事务内操作）
-        hashed_password = hash_password(user_data.password)
-        user_obj = await user_repository.create_user(
-            username=user_data.username,
-            password=hashed_password,
-            activation_code=user_data.activation_code
-        )
+        整个方法在事务中执行，确保用户创建和激活码激活的原子性
 
-        # 4. 激活激活码（事务内操作）
-        await activation_service.activate_activation_code(user_data.activation_code)
-        log.info(f"用户 {user_data.username} 注册成功，激活码 {user_data.activation_code} 已激活")
+        Args:
+            user_data: 用户注册请求
+            hashed_password: 已哈希的密码
 
-        return UserResponse.model_validate(user_obj, from_attributes=True)
+        Returns:
+            用户响应
+
+        Raises:
+            BusinessException: 激活码不可用或用户名已存在
+        """
+        # 1. 锁定并激活已分发的激活码（事务内操作，失败时随事务回滚）
+        await activation_service.claim_activation_code(user_data.activation_code)
+
+        # 2. 创建用户（事务内操作），用户名唯一性由 uk_username 唯一索引保证
+        try:
+            user_obj = await user_repository.create_user(
+                username=user_data.username,
+                password=hashed_password,
+                activation_code=user_data.activation_code
+            )
+        except IntegrityError:
+            raise BusinessException(message="用户名已存在", code=400)
+
+        log.info("用户 {} 注册成功，激活码 {} 已激活", user_data.username, user_data.activation_code)
+
+        return self._to_user_response(user_obj)
 
     async def get_user_by_id(self, user_id: int) -> UserResponse:
         """
@@ -60,7 +78,7 @@ class UserService:
         if not user:
             raise BusinessException(message="用户不存在", code=404)
 
-        return UserResponse.model_validate(user, from_attributes=True)
+        return self._to_user_response(user)
 
     async def update_user(self, user_id: int, user_data: UserUpdateRequest) -> UserResponse:
         """
@@ -76,28 +94,30 @@ class UserService:
         Raises:
             BusinessException: 用户不存在或字段冲突
         """
-        user = await user_repository.get_by_id(user_id)
-        if not user:
-            raise BusinessException(message="用户不存在", code=404)
-
         update_data = user_data.model_dump(exclude_unset=True)
         if not update_data:
-            return UserResponse.model_validate(user, from_attributes=True)
-
-        # 检查唯一性约束（仅对非空字段）
-        is_conflict = await self.check_user_fields_unique(
-            user_id=user_id,
-            username=update_data.get("username"),
-            phone=update_data.get("phone"),
-            email=update_data.get("email")
+            return await self.get_user_by_id(user_id)
+
+        # 查询用户与唯一性检查（仅对非空字段）互不依赖，并发执行
+        user, is_conflict = await asyncio.gather(
+            user_repository.get_by_id(user_id),
+            self.check_user_fields_unique(
+                user_id=user_id,
+                username=update_data.get("username"),
+                phone=update_data.get("phone"),
+                email=update_data.get("email")
+            )
         )
 
+        if not user:
+            raise BusinessException(message="用户不存在", code=404)
+
         if is_conflict:
             raise BusinessException(message="用户名、手机号或邮箱已被使用", code=400)
 
         await user_repository.update_user(user, **update_data)
 
-        return UserResponse.model_validate(user, from_attributes=True)
+        return self._to_user_response(user)
 
     def get_user_list(self, params: UserQueryRequest):
         """
@@ -116,18 +136,6 @@ class UserService:
             activation_code=params.activation_code
         )
 
-    async def check_username_unique(self, username: str) -> bool:
-        """
-        检查用户名是否已存在
-
-        Args:
-            username (str): 待检查的用户名
-
-        Returns:
-            bool: True 表示已存在（不唯一），False 表示可用（唯一）
-        """
-        return await user_repository.username_exists(username)
-
     async def check_user_fields_unique(
         self,
         user_id: int,
@@ -170,6 +178,23 @@ class UserService:
 
         return await query.filter(conditions).exists()
 
+    # ========== 辅助方法 ==========
+
+    def _to_user_response(self, user: User) -> UserResponse:
+        """
+        转换为响应对象
+
+        数据来自数据库，字段类型已可信，使用 model_construct 跳过校验
+        """
+        return UserResponse.model_construct(
+            id=user.id,
+            username=user.username,
+            phone=user.phone,
+            email=user.email,
+            activation_code=user.activation_code,
+            created_at=user.created_at,
+            updated_at=user.updated_at
+        )
 
 
 # 创建服务实例
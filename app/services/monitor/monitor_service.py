@@ -1,5 +1,7 @@
 from typing import List
 
+from pydantic import TypeAdapter
+
 from app.core.exceptions import BusinessException
 from app.core.logging import log
 from app.repositories.monitor.monitor_config_repository import monitor_config_repository
@@ -15,6 +17,9 @@ from app.schemas.monitor.monitor import (
 )
 from app.util.time_util import get_utc_now
 
+# 每日数据列表的批量校验器（模块级复用，避免逐条 model_validate）
+_DAILY_STATS_ADAPTER = TypeAdapter(List[MonitorDailyStatsResponse])
+
 
 class MonitorService:
     """监控服务类"""
@@ -30,7 +35,7 @@ class MonitorService:
         Returns:
             监控配置响应
         """
-        log.info(f"用户{user_id}创建监控配置，渠道：{request.channel_code}，链接：{request.target_url}")
+        log.info("用户{}创建监控配置，渠道：{}，链接：{}", user_id, request.channel_code, request.target_url)
 
         # TODO: 执行爬虫任务解析链接，获取账号信息
 
@@ -41,7 +46,7 @@ class MonitorService:
             is_active=1
         )
 
-        log.info(f"监控配置创建成功，ID：{config.id}")
+        log.info("监控配置创建成功，ID：{}", config.id)
         return MonitorConfigResponse.model_validate(config, from_attributes=True)
 
     def get_monitor_config_queryset(self, user_id: int, params: MonitorConfigQueryRequest):
@@ -61,68 +66,59 @@ class MonitorService:
         self,
         user_id: int,
         request: MonitorConfigUpdateRequest
-    ) -> MonitorConfigResponse:
+    ) -> bool:
         """
         修改监控配置
 
         Args:
             user_id: 用户 ID
-            config_id: 配置 ID
             request: 更新请求
 
         Returns:
-            监控配置响应
+            是否修改成功
 
         Raises:
             BusinessException: 监控配置不存在
         """
-        log.info(f"用户{user_id}修改监控配置{request.id}，新链接：{request.target_url}")
-
-        # 查询配置
-        config = await monitor_config_repository.find_by_id(request.id, user_id)
-        if not config:
-            raise BusinessException(message="监控配置不存在")
+        log.info("用户{}修改监控配置{}，新链接：{}", user_id, request.id, request.target_url)
 
         # TODO: 执行爬虫任务解析新链接
 
-        config = await monitor_config_repository.update_monitor_config(
-            config,
-            target_url=request.target_url if request.target_url else None
-        )
+        affected = await monitor_config_repository.update_target_url(request.id, user_id, request.target_url)
+        # MySQL 对未产生变化的 UPDATE 返回 0 行，需再确认配置是否真的不存在
+        if not affected and not await monitor_config_repository.config_exists(request.id, user_id):
+            raise BusinessException(message="监控配置不存在")
 
-        log.info(f"监控配置{request.id}修改成功")
-        return MonitorConfigResponse.model_validate(config, from_attributes=True)
+        log.info("监控配置{}修改成功", request.id)
+        return True
 
     async def toggle_monitor_config(
         self,
         user_id: int,
         request: MonitorConfigToggleRequest
-    ) -> MonitorConfigResponse:
+    ) -> bool:
         """
         切换监控状态
 
         Args:
             user_id: 用户 ID
-            config_id: 配置 ID
             request: 切换请求
 
         Returns:
-            监控配置响应
+            是否切换成功
 
         Raises:
             BusinessException: 监控配置不存在
         """
-        log.info(f"用户{user_id}切换监控配置{request.id}状态为：{request.is_active}")
+        log.info("用户{}切换监控配置{}状态为：{}", user_id, request.id, request.is_active)
 
-        # 查询配置
-        config = await monitor_config_repository.find_by_id(request.id, user_id)
-        if not config:
+        affected = await monitor_config_repository.toggle_monitor_status(request.id, user_id, request.is_active)
+        # MySQL 对未产生变化的 UPDATE 返回 0 行，需再确认配置是否真的不存在
+        if not affected and not await monitor_config_repository.config_exists(request.id, user_id):
             raise BusinessException(message="监控配置不存在")
 
-        config = await monitor_config_repository.toggle_monitor_status(config, request.is_active)
-
-        log.info(f"监控配置{request.id}状态切换成功")
-        return MonitorConfigResponse.model_validate(config, from_attributes=True)
+        log.info("监控配置{}状态切换成功", request.id)
+        return True
 
     async def delete_monitor_config(self, user_id: int, id: int) -> bool:
         """
@@ -130,7 +126,7 @@ class MonitorService:
 
         Args:
             user_id: 用户 ID
-            config_id: 配置 ID
+            id: 配置 ID
 
         Returns:
             是否删除成功
@@ -138,16 +134,13 @@ class MonitorService:
         Raises:
             BusinessException: 监控配置不存在
         """
-        log.info(f"用户{user_id}删除监控配置{id}")
+        log.info("用户{}删除监控配置{}", user_id, id)
 
-        # 查询配置
-        config = await monitor_config_repository.find_by_id(id, user_id)
-        if not config:
+        affected = await monitor_config_repository.soft_delete_by_id(id, user_id)
+        if not affected:
             raise BusinessException(message="监控配置不存在")
 
-        await monitor_config_repository.soft_delete_config(config)
-
-        log.info(f"监控配置{id}删除成功")
+        log.info("监控配置{}删除成功", id)
         return True
 
     async def get_daily_stats(
@@ -169,20 +162,21 @@ class MonitorService:
             BusinessException: 监控配置不存在
         """
         log.info(
-            f"用户{user_id}查询配置{request.config_id}的每日数据，时间范围：{request.start_date} ~ {request.end_date}")
+            "用户{}查询配置{}的每日数据，时间范围：{} ~ {}",
+            user_id, request.config_id, request.start_date, request.end_date
+        )
 
         # 验证配置归属
-        config = await monitor_config_repository.find_by_id(request.config_id, user_id)
-        if not config:
+        if not await monitor_config_repository.config_exists(request.config_id, user_id):
             raise BusinessException(message="监控配置不存在")
 
-        stats = await monitor_daily_stats_repository.find_by_config_and_date_range(
+        rows = await monitor_daily_stats_repository.find_by_config_and_date_range(
             config_id=request.config_id,
             start_date=request.start_date,
             end_date=request.end_date
         )
 
-        return [MonitorDailyStatsResponse.model_validate(stat, from_attributes=True) for stat in stats]
+        return _DAILY_STATS_ADAPTER.validate_python(rows)
 
 
 # 创建服务实例
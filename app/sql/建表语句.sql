@@ -12,7 +12,7 @@ CREATE TABLE `activation_codes` (
     PRIMARY KEY (`id`) USING BTREE,
     UNIQUE KEY `uk_activation_code` (`activation_code`) USING BTREE,
     KEY `idx_status` (`status`) USING BTREE,
-    KEY `idx_type` (`type`) USING BTREE,
+    KEY `idx_type_status` (`type`, `status`) USING BTREE,
     KEY `idx_created_at` (`created_at`) USING BTREE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci ROW_FORMAT=DYNAMIC COMMENT='激活码表';
 
@@ -4,8 +4,11 @@ import os
 import sys
 from typing import List, Dict, Any
 
+from tortoise.transactions import in_transaction
+
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
+from app.core.exceptions import BusinessException
 from app.db.config import init_db, close_db
 from app.models.account.account import Account, AccountProjectChannel
 from app.models.account.setting import Setting
@@ -13,12 +16,15 @@ from app.enums.common.channel import ChannelEnum
 from app.enums.common.project import ProjectEnum
 from app.enums.settings import SettingGroupEnum, GeneralSettingEnum
 from app.schemas.account.account import (
-    AccountCreateRequest, AccountUpdateRequest,
+    AccountCreateRequest, AccountUpdateRequest, AccountQueryRequest,
     BindingRequest
 )
 from app.schemas.account.setting import SettingUpdateRequest
-from app.services.account.account_service import AccountService
-from app.services.account.setting_service import SettingService
+from app.services.account.account_service import account_service
+from app.services.account.setting_service import setting_service
+
+# 测试中反复使用的配置项键
+AUTO_DOWNLOAD_KEY = GeneralSettingEnum.AUTO_DOWNLOAD.code
 
 
 class AccountTester:
@@ -27,8 +33,8 @@ class AccountTester:
     def __init__(self):
         self.test_results: List[Dict[str, Any]] = []
         self.test_user_id = 1
-        self.account_service = AccountService()
-        self.setting_service = SettingService()
+        self.account_service = account_service
+        self.setting_service = setting_service
         self.created_account_id = None
 
     @staticmethod
@@ -40,9 +46,10 @@ class AccountTester:
     @staticmethod
     async def cleanup_test_database():
         print("正在清理测试数据库...")
-        await Setting.all().delete()
-        await AccountProjectChannel.all().delete()
-        await Account.all().delete()
+        async with in_transaction():
+            await Setting.all().delete()
+            await AccountProjectChannel.all().delete()
+            await Account.all().delete()
         await close_db()
         print("测试数据库清理完成")
 
@@ -59,10 +66,11 @@ class AccountTester:
         """测试1: 渠道枚举"""
         print("\n测试1: 渠道枚举")
         try:
-            assert len(list(ChannelEnum)) == 4, "应该有4个渠道"
+            channels = list(ChannelEnum)
+            assert len(channels) == 4, "应该有4个渠道"
             assert ChannelEnum.BILIBILI.code == 3
             assert ChannelEnum.WECHAT_VIDEO.code == 4
-            self.log_test_result("渠道枚举", True, f"共{len(list(ChannelEnum))}个渠道")
+            self.log_test_result("渠道枚举", True, f"共{len(channels)}个渠道")
         except Exception as e:
             self.log_test_result("渠道枚举", False, str(e))
 
@@ -73,9 +81,10 @@ class AccountTester:
             project = ProjectEnum.AI_LANDSCAPE
             assert project.code == 1
             assert project.desc == "AI风景号"
-            assert len(project.channels) == 3
-            assert ChannelEnum.BILIBILI in project.channels
-            self.log_test_result("项目枚举", True, f"AI风景号支持{len(project.channels)}个渠道")
+            channels = project.channels
+            assert len(channels) == 3
+            assert ChannelEnum.BILIBILI in channels
+            self.log_test_result("项目枚举", True, f"AI风景号支持{len(channels)}个渠道")
         except Exception as e:
             self.log_test_result("项目枚举", False, str(e))
 
@@ -117,7 +126,8 @@ class AccountTester:
         """测试5: 获取账号列表"""
         print("\n测试5: 获取账号列表")
         try:
-            accounts = await self.account_service.get_accounts(self.test_user_id)
+            params = AccountQueryRequest(user_id=self.test_user_id)
+            accounts = await self.account_service.get_account_queryset(params)
             assert len(accounts) >= 1
             self.log_test_result("获取账号列表", True, f"共{len(accounts)}个账号")
         except Exception as e:
@@ -132,23 +142,26 @@ class AccountTester:
                 name="更新后账号名",
                 description="更新后描述"
             )
-            result = await self.account_service.update_account(self.test_user_id, request)
+            result = await self.account_service.update_account(request)
             assert result.name == "更新后账号名"
             self.log_test_result("更新账号", True, f"名称更新为: {result.name}")
         except Exception as e:
             self.log_test_result("更新账号", False, str(e))
 
-    async def test_get_nonexistent_account(self):
-        """测试7: 获取不存在的账号"""
-        print("\n测试7: 获取不存在的账号")
+    async def test_update_nonexistent_account(self):
+        """测试7: 更新不存在的账号"""
+        print("\n测试7: 更新不存在的账号")
         try:
-            await self.account_service.get_bindings(self.test_user_id, 99999)
-            self.log_test_result("获取不存在的账号", False, "应该抛出异常")
-        except Exception as e:
-            if "账号不存在" in str(e):
-                self.log_test_result("获取不存在的账号", True, "正确抛出异常")
+            request = AccountUpdateRequest(id=99999, name="不存在的账号")
+            await self.account_service.update_account(request)
+            self.log_test_result("更新不存在的账号", False, "应该抛出异常")
+        except BusinessException as e:
+            if "账号不存在" in e.message:
+                self.log_test_result("更新不存在的账号", True, "正确抛出异常")
             else:
-                self.log_test_result("获取不存在的账号", False, str(e))
+                self.log_test_result("更新不存在的账号", False, e.message)
+        except Exception as e:
+            self.log_test_result("更新不存在的账号", False, f"异常类型错误: {e!r}")
 
     # ========== 绑定测试 ==========
 
@@ -156,18 +169,18 @@ class AccountTester:
         """测试8: 绑定项目渠道"""
         print("\n测试8: 绑定项目渠道")
         try:
+            project_code = ProjectEnum.AI_LANDSCAPE.code
+            channel_code = ChannelEnum.BILIBILI.code
             request = BindingRequest(
-                project_code=ProjectEnum.AI_LANDSCAPE.code,
-                channel_code=ChannelEnum.BILIBILI.code,
+                project_code=project_code,
+                channel_codes=[channel_code],
                 browser_id="test_browser_001"
             )
-            result = await self.account_service.bindding(
-                self.test_user_id, self.created_account_id, request
-            )
-            assert result.project_code == ProjectEnum.AI_LANDSCAPE.code
-            assert result.channel_code == ChannelEnum.BILIBILI.code
+            result = await self.account_service.bindding(self.created_account_id, request)
+            assert result.project_code == project_code
+            assert result.channel_codes == [channel_code]
             assert result.browser_id == "test_browser_001"
-            self.log_test_result("绑定项目渠道", True, f"{result.project_name}/{result.channel_name}")
+            self.log_test_result("绑定项目渠道", True, f"{result.project_name}/{','.join(result.channel_names)}")
         except Exception as e:
             self.log_test_result("绑定项目渠道", False, str(e))
 
@@ -177,26 +190,24 @@ class AccountTester:
         try:
             request = BindingRequest(
                 project_code=ProjectEnum.AI_LANDSCAPE.code,
-                channel_code=ChannelEnum.YOUTUBE.code,  # AI风景号不支持YouTube
+                channel_codes=[ChannelEnum.YOUTUBE.code],  # AI风景号不支持YouTube
                 browser_id="test_browser"
             )
-            await self.account_service.bindding(
-                self.test_user_id, self.created_account_id, request
-            )
+            await self.account_service.bindding(self.created_account_id, request)
             self.log_test_result("绑定不支持的渠道", False, "应该抛出异常")
-        except Exception as e:
-            if "不支持渠道" in str(e):
+        except BusinessException as e:
+            if "不支持渠道" in e.message:
                 self.log_test_result("绑定不支持的渠道", True, "正确抛出异常")
             else:
-                self.log_test_result("绑定不支持的渠道", False, str(e))
+                self.log_test_result("绑定不支持的渠道", False, e.message)
+        except Exception as e:
+            self.log_test_result("绑定不支持的渠道", False, f"异常类型错误: {e!r}")
 
     async def test_get_bindings(self):
         """测试10: 获取绑定列表"""
         print("\n测试10: 获取绑定列表")
         try:
-            bindings = await self.account_service.get_bindings(
-                self.test_user_id, self.created_account_id
-            )
+            bindings = await self.account_service.get_bindings(self.created_account_id)
             assert len(bindings) >= 1
             self.log_test_result("获取绑定列表", True, f"共{len(bindings)}个绑定")
         except Exception as e:
@@ -210,7 +221,7 @@ class AccountTester:
         try:
             # 先设置用户配置
             user_request = SettingUpdateRequest(
-                setting_key=GeneralSettingEnum.AUTO_DOWNLOAD.code,
+                setting_key=AUTO_DOWNLOAD_KEY,
                 setting_value=True
             )
             await self.setting_service.update_setting(self.test_user_id, user_request)
@@ -219,14 +230,11 @@ class AccountTester:
             result = await self.setting_service.get_account_all_settings(
                 self.created_account_id, self.test_user_id
             )
-            # 找到对应配置项
-            found = False
-            for group in result.groups:
-                for setting in group.settings:
-                    if setting.setting_key == GeneralSettingEnum.AUTO_DOWNLOAD.code:
-                        assert setting.setting_value == True
-                        found = True
-            assert found, "应该找到配置项"
+            # 按 setting_key 建立索引后查找对应配置项
+            settings_by_key = {s.setting_key: s for g in result.groups for s in g.settings}
+            setting = settings_by_key.get(AUTO_DOWNLOAD_KEY)
+            assert setting is not None, "应该找到配置项"
+            assert setting.setting_value is True
             self.log_test_result("账号配置继承用户配置", True, "继承成功")
         except Exception as e:
             self.log_test_result("账号配置继承用户配置", False, str(e))
@@ -237,14 +245,14 @@ class AccountTester:
         try:
             # 设置账号配置（覆盖用户配置）
             request = SettingUpdateRequest(
-                setting_key=GeneralSettingEnum.AUTO_DOWNLOAD.code,
+                setting_key=AUTO_DOWNLOAD_KEY,
                 setting_value=False
             )
             result = await self.setting_service.update_account_setting(
                 self.created_account_id, request
             )
-            assert result.setting_value == False
-            assert result.is_default == False
+            assert result.setting_value is False
+            assert result.is_default is False
             self.log_test_result("账号配置覆盖用户配置", True, f"覆盖为: {result.setting_value}")
         except Exception as e:
             self.log_test_result("账号配置覆盖用户配置", False, str(e))
@@ -255,9 +263,9 @@ class AccountTester:
         try:
             result = await self.setting_service.reset_account_setting(
                 self.created_account_id,
-                GeneralSettingEnum.AUTO_DOWNLOAD.code
+                AUTO_DOWNLOAD_KEY
             )
-            assert result.is_default == True
+            assert result.is_default is True
             self.log_test_result("重置账号配置", True, "重置成功")
         except Exception as e:
             self.log_test_result("重置账号配置", False, str(e))
@@ -269,10 +277,10 @@ class AccountTester:
             value = await self.setting_service.get_effective_setting(
                 self.created_account_id,
                 self.test_user_id,
-                GeneralSettingEnum.AUTO_DOWNLOAD.code
+                AUTO_DOWNLOAD_KEY
             )
             # 账号配置已重置，应该继承用户配置
-            assert value == True
+            assert value is True
             self.log_test_result("获取有效配置", True, f"有效值: {value}")
         except Exception as e:
             self.log_test_result("获取有效配置", False, str(e))
@@ -283,12 +291,13 @@ class AccountTester:
         """测试15: 删除账号"""
         print("\n测试15: 删除账号")
         try:
-            await self.account_service.delete_account(self.test_user_id, self.created_account_id)
-            # 验证已删除（软删除）
-            accounts = await self.account_service.get_accounts(self.test_user_id)
+            await self.account_service.delete_account(self.created_account_id)
+            # 验证已删除
+            params = AccountQueryRequest(user_id=self.test_user_id)
+            accounts = await self.account_service.get_account_queryset(params)
             for acc in accounts:
                 assert acc.id != self.created_account_id, "账号应该已被删除"
-            self.log_test_result("删除账号", True, "软删除成功")
+            self.log_test_result("删除账号", True, "删除成功")
         except Exception as e:
             self.log_test_result("删除账号", False, str(e))
 
@@ -297,19 +306,21 @@ class AccountTester:
         print("开始账号模块测试")
         print("=" * 80)
 
+        # 枚举测试（互不依赖且不访问数据库，在初始化数据库前并发执行）
+        await asyncio.gather(
+            self.test_channel_enum(),
+            self.test_project_enum(),
+            self.test_project_to_dict()
+        )
+
         try:
             await self.setup_test_database()
 
-            # 枚举测试
-            await self.test_channel_enum()
-            await self.test_project_enum()
-            await self.test_project_to_dict()
-
             # 账号管理测试
             await self.test_create_account()
             await self.test_get_accounts()
             await self.test_update_account()
-            await self.test_get_nonexistent_account()
+            await self.test_update_nonexistent_account()
 
             # 绑定测试
             await self.test_bindding()
@@ -341,4 +352,9 @@ async def main():
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
@@ -2,12 +2,17 @@
 import asyncio
 import os
 import sys
-from datetime import datetime
-from typing import List, Dict, Any
+import time
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Type
+
+from pydantic import ValidationError
+from tortoise.functions import Count
 
 # 添加项目根目录到Python路径
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
+from app.core.exceptions import BusinessException
 from app.db.config import init_db, close_db
 from app.models.account.activation_code import ActivationCode
 from app.schemas.account.activation import (
@@ -17,10 +22,33 @@ from app.schemas.account.activation import (
     ActivationCodeInvalidateRequest,
     ActivationCodeQueryRequest
 )
-from app.services.account.activation_service import ActivationCodeService
+from app.services.account.activation_service import activation_service
 from app.enums.account.activation_type import ActivationTypeEnum
 from app.enums.account.activation_status import ActivationCodeStatusEnum
 
+# 测试中反复使用的状态码
+STATUS_UNUSED = ActivationCodeStatusEnum.UNUSED.code
+STATUS_DISTRIBUTED = ActivationCodeStatusEnum.DISTRIBUTED.code
+STATUS_ACTIVATED = ActivationCodeStatusEnum.ACTIVATED.code
+STATUS_INVALID = ActivationCodeStatusEnum.INVALID.code
+
+# 并发执行测试时，当前测试的输出缓冲区（为 None 时直接打印）
+_output_buffer: ContextVar[Optional[List[str]]] = ContextVar("_output_buffer", default=None)
+
+
+async def _expect_raises(
+    call: Callable[[], Awaitable[Any]],
+    expected: Type[Exception] = BusinessException
+) -> Optional[str]:
+    """执行调用，抛出预期类型的异常时返回 None，否则返回失败原因"""
+    try:
+        await call()
+    except expected:
+        return None
+    except Exception as e:
+        return f"异常类型错误: {e!r}"
+    return "应该抛出异常但没有"
+
 
 class ActivationCodeTester:
     """激活码模块测试类"""
@@ -52,18 +80,39 @@ class ActivationCodeTester:
             "success": success,
             "message": message,
             "data": data,
-            "timestamp": datetime.now()
+            "timestamp_ns": time.perf_counter_ns()
         }
         self.test_results.append(result)
 
         status = "✓ 成功" if success else "✗ 失败"
-        print(f"  {status}: {test_name}")
+        self.output(f"  {status}: {test_name}")
         if message:
-            print(f"    {message}")
+            self.output(f"    {message}")
+
+    @staticmethod
+    def output(text: str):
+        """输出测试信息，在 run_buffered 中执行时写入当前测试的缓冲区"""
+        buffer = _output_buffer.get()
+        if buffer is None:
+            print(text)
+        else:
+            buffer.append(text)
+
+    async def run_buffered(self, test: Callable[[], Awaitable[Any]]) -> List[str]:
+        """执行一个测试并返回它的全部输出，用于并发执行后按测试依次打印"""
+        buffer: List[str] = []
+        # gather 为每个协程创建独立任务并复制上下文，这里的设置只影响当前测试
+        _output_buffer.set(buffer)
+        try:
+            await test()
+        except Exception as e:
+            # 单个测试异常不影响其他测试输出
+            self.log_test_result(test.__name__, False, f"测试执行异常: {e!r}")
+        return buffer
 
     async def test_activation_code_initialization(self):
         """测试激活码初始化功能"""
-        print("\n测试1: 激活码初始化功能")
+        self.output("\n测试1: 激活码初始化功能")
 
         try:
             # 创建批量初始化请求
@@ -76,7 +125,7 @@ class ActivationCodeTester:
             )
 
             # 执行初始化
-            result = await ActivationCodeService.init_activation_codes(request)
+            result = await activation_service.init_activation_codes(request)
 
             # 验证结果
             assert result.total_count == 6, f"期望创建6个激活码，实际创建{result.total_count}个"
@@ -101,23 +150,27 @@ class ActivationCodeTester:
 
     async def test_activation_code_distribution(self):
         """测试激活码分发功能"""
-        print("\n测试2: 激活码分发功能")
+        self.output("\n测试2: 激活码分发功能")
 
         try:
             # 分发日卡激活码
             request = ActivationCodeGetRequest(type=ActivationTypeEnum.DAY.code, count=2)
-            distributed_codes = await ActivationCodeService.distribute_activation_codes(request)
+            distributed_codes = await activation_service.distribute_activation_codes(request)
 
             # 验证分发结果
             assert len(distributed_codes) == 2, f"期望分发2个激活码，实际分发{len(distributed_codes)}个"
 
-            # 验证数据库中的状态更新
+            # 验证数据库中的状态更新（一次查询取回全部分发的激活码）
+            rows = await ActivationCode.filter(activation_code__in=distributed_codes).values(
+                "activation_code", "status", "distributed_at", "activated_at"
+            )
+            codes_by_str = {row["activation_code"]: row for row in rows}
             for code_str in distributed_codes:
-                code = await ActivationCode.get_or_none(activation_code=code_str)
+                code = codes_by_str.get(code_str)
                 assert code is not None, f"激活码{code_str}未找到"
-                assert code.status == ActivationCodeStatusEnum.DISTRIBUTED.code, f"激活码状态错误"
-                assert code.distributed_at is not None, f"分发时间未设置"
-                assert code.activated_at is None, f"激活时间不应设置"
+                assert code["status"] == STATUS_DISTRIBUTED, f"激活码状态错误"
+                assert code["distributed_at"] is not None, f"分发时间未设置"
+                assert code["activated_at"] is None, f"激活时间不应设置"
 
             self.log_test_result(
                 "激活码分发",
@@ -131,26 +184,28 @@ class ActivationCodeTester:
 
     async def test_activation_code_activation(self):
         """测试激活码激活功能"""
-        print("\n测试3: 激活码激活功能")
+        self.output("\n测试3: 激活码激活功能")
 
         try:
             # 获取一个已分发的激活码进行激活
             distributed_code = await ActivationCode.filter(
-                status=ActivationCodeStatusEnum.DISTRIBUTED.code
-            ).first()
+                status=STATUS_DISTRIBUTED
+            ).only("id", "activation_code", "status").first()
 
             assert distributed_code is not None, "没有找到已分发的激活码"
 
             # 执行激活
-            result = await ActivationCodeService.activate_activation_code(distributed_code.activation_code)
+            result = await activation_service.activate_activation_code(distributed_code.activation_code)
 
             # 验证激活结果
             assert result.activation_code == distributed_code.activation_code, "激活码不匹配"
-            assert result.status == ActivationCodeStatusEnum.ACTIVATED.code, "激活后状态错误"
+            assert result.status == STATUS_ACTIVATED, "激活后状态错误"
 
             # 验证数据库中的更新
-            updated_code = await ActivationCode.get(id=distributed_code.id)
-            assert updated_code.status == ActivationCodeStatusEnum.ACTIVATED.code, "数据库状态未更新"
+            updated_code = await ActivationCode.get(id=distributed_code.id).only(
+                "id", "status", "activated_at", "expire_time"
+            )
+            assert updated_code.status == STATUS_ACTIVATED, "数据库状态未更新"
             assert updated_code.activated_at is not None, "激活时间未设置"
             assert updated_code.expire_time is not None, "过期时间未设置"
 
@@ -169,38 +224,38 @@ class ActivationCodeTester:
 
     async def test_activation_code_invalidation(self):
         """测试激活码作废功能"""
-        print("\n测试4: 激活码作废功能")
+        self.output("\n测试4: 激活码作废功能")
 
         try:
             # 获取一个已分发的激活码进行作废
             distributed_code = await ActivationCode.filter(
-                status=ActivationCodeStatusEnum.DISTRIBUTED.code
-            ).first()
+                status=STATUS_DISTRIBUTED
+            ).only("activation_code", "status").first()
 
             if distributed_code is None:
-                # 如果没有已分发的激活码，先分发一个
+                # 如果没有已分发的激活码，先分发一个（刚分发的状态已知，无需回查）
                 request = ActivationCodeGetRequest(type=ActivationTypeEnum.MONTH.code, count=1)
-                codes = await ActivationCodeService.distribute_activation_codes(request)
-                distributed_code = await ActivationCode.get(activation_code=codes[0])
+                codes = await activation_service.distribute_activation_codes(request)
+                code_str, original_status = codes[0], STATUS_DISTRIBUTED
+            else:
+                code_str, original_status = distributed_code.activation_code, distributed_code.status
 
             # 执行作废
-            invalidate_request = ActivationCodeInvalidateRequest(
-                activation_code=distributed_code.activation_code
-            )
-            result = await ActivationCodeService.invalidate_activation_code(invalidate_request)
+            invalidate_request = ActivationCodeInvalidateRequest(activation_code=code_str)
+            result = await activation_service.invalidate_activation_code(invalidate_request)
 
             # 验证作废结果
             assert result is True, "作废操作失败"
 
             # 验证数据库中的更新
-            invalidated_code = await ActivationCode.get(id=distributed_code.id)
-            assert invalidated_code.status == ActivationCodeStatusEnum.INVALID.code, "作废后状态错误"
+            invalidated_code = await ActivationCode.get(activation_code=code_str).only("id", "status")
+            assert invalidated_code.status == STATUS_INVALID, "作废后状态错误"
 
             self.log_test_result(
                 "激活码作废",
                 True,
-                f"成功作废激活码 {distributed_code.activation_code}",
-                {"original_status": distributed_code.status, "new_status": invalidated_code.status}
+                f"成功作废激活码 {code_str}",
+                {"original_status": original_status, "new_status": invalidated_code.status}
             )
 
         except Exception as e:
@@ -208,7 +263,7 @@ class ActivationCodeTester:
 
     async def test_activation_code_query(self):
         """测试激活码查询功能"""
-        print("\n测试5: 激活码查询功能")
+        self.output("\n测试5: 激活码查询功能")
 
         try:
             # 测试分页查询
@@ -216,23 +271,23 @@ class ActivationCodeTester:
                 page=1,
                 size=5,
                 type=ActivationTypeEnum.DAY.code,
-                status=ActivationCodeStatusEnum.UNUSED.code
+                status=STATUS_UNUSED
             )
 
-            queryset = ActivationCodeService.get_activation_code_queryset(query_request)
+            queryset = activation_service.get_activation_code_list(query_request)
             results = await queryset
 
             # 验证查询结果
             for result in results:
                 assert result.type == ActivationTypeEnum.DAY.code, "类型过滤错误"
-                assert result.status == ActivationCodeStatusEnum.UNUSED.code, "状态过滤错误"
+                assert result.status == STATUS_UNUSED, "状态过滤错误"
 
             # 测试按激活码查询
             if self.created_codes:
                 single_query = ActivationCodeQueryRequest(
                     activation_code=self.created_codes[0]
                 )
-                single_queryset = ActivationCodeService.get_activation_code_queryset(single_query)
+                single_queryset = activation_service.get_activation_code_list(single_query)
                 single_results = await single_queryset
 
                 assert len(single_results) <= 1, "精确查询结果过多"
@@ -251,14 +306,14 @@ class ActivationCodeTester:
 
     async def test_complete_business_flow(self):
         """测试完整的业务流程"""
-        print("\n测试6: 完整业务流程测试")
+        self.output("\n测试6: 完整业务流程测试")
 
         try:
             # 1. 初始化永久卡激活码
             batch_request = ActivationCodeBatchCreateRequest(
                 items=[ActivationCodeCreateItem(type=ActivationTypeEnum.PERMANENT.code, count=1)]
             )
-            batch_result = await ActivationCodeService.init_activation_codes(batch_request)
+            batch_result = await activation_service.init_activation_codes(batch_request)
 
             test_code = batch_result.results[0].activation_codes[0]
 
@@ -267,17 +322,17 @@ class ActivationCodeTester:
                 type=ActivationTypeEnum.PERMANENT.code,
                 count=1
             )
-            distributed_codes = await ActivationCodeService.distribute_activation_codes(get_request)
+            distributed_codes = await activation_service.distribute_activation_codes(get_request)
 
             assert test_code in distributed_codes, "分发失败"
 
             # 3. 激活激活码
-            activate_result = await ActivationCodeService.activate_activation_code(test_code)
+            activate_result = await activation_service.activate_activation_code(test_code)
 
-            assert activate_result.status == ActivationCodeStatusEnum.ACTIVATED.code, "激活失败"
+            assert activate_result.status == STATUS_ACTIVATED, "激活失败"
 
             # 4. 查询激活码详情
-            detail_result = await ActivationCodeService.get_activation_code_by_code(test_code)
+            detail_result = await activation_service.get_activation_code_by_code(test_code)
 
             assert detail_result.activation_code == test_code, "详情查询失败"
             assert detail_result.distributed_at is not None, "分发时间缺失"
@@ -286,7 +341,7 @@ class ActivationCodeTester:
 
             # 5. 作废激活码
             invalidate_request = ActivationCodeInvalidateRequest(activation_code=test_code)
-            invalidate_result = await ActivationCodeService.invalidate_activation_code(invalidate_request)
+            invalidate_result = await activation_service.invalidate_activation_code(invalidate_request)
 
             assert invalidate_result is True, "作废失败"
 
@@ -308,51 +363,56 @@ class ActivationCodeTester:
 
     async def test_exception_scenarios(self):
         """测试异常场景"""
-        print("\n测试7: 异常场景测试")
-
-        exception_tests = []
-
-        # 测试1: 分发不存在的激活码类型
-        try:
-            request = ActivationCodeGetRequest(type=999, count=1)
-            await ActivationCodeService.distribute_activation_codes(request)
-            exception_tests.append({"test": "分发不存在类型", "success": False, "reason": "应该抛出异常但没有"})
-        except Exception:
-            exception_tests.append({"test": "分发不存在类型", "success": True})
+        self.output("\n测试7: 异常场景测试")
+
+        # 子测试 2、3 共用同一个未分发激活码，只查询一次
+        unused_code = await ActivationCode.filter(
+            status=STATUS_UNUSED
+        ).only("id", "activation_code").first()
+
+        # (名称, 调用, 预期异常类型)；不存在的类型在请求校验阶段即被拒绝
+        checks = [
+            (
+                "分发不存在类型",
+                lambda: activation_service.distribute_activation_codes(
+                    ActivationCodeGetRequest(type=999, count=1)
+                ),
+                ValidationError
+            ),
+            (
+                "激活不存在激活码",
+                lambda: activation_service.activate_activation_code("non_existent_code"),
+                BusinessException
+            )
+        ]
+        if unused_code:
+            checks += [
+                (
+                    "激活未分发激活码",
+                    lambda: activation_service.activate_activation_code(unused_code.activation_code),
+                    BusinessException
+                ),
+                (
+                    "作废未分发激活码",
+                    lambda: activation_service.invalidate_activation_code(
+                        ActivationCodeInvalidateRequest(activation_code=unused_code.activation_code)
+                    ),
+                    BusinessException
+                )
+            ]
 
-        # 测试2: 激活未分发的激活码
-        try:
-            unused_code = await ActivationCode.filter(
-                status=ActivationCodeStatusEnum.UNUSED.code
-            ).first()
-            if unused_code:
-                await ActivationCodeService.activate_activation_code(unused_code.activation_code)
-                exception_tests.append({"test": "激活未分发激活码", "success": False, "reason": "应该抛出异常但没有"})
-            else:
-                exception_tests.append({"test": "激活未分发激活码", "success": True, "reason": "没有未分发的激活码"})
-        except Exception:
-            exception_tests.append({"test": "激活未分发激活码", "success": True})
+        # 各异常场景互不依赖，并发执行
+        reasons = await asyncio.gather(*(_expect_raises(call, expected) for _, call, expected in checks))
 
-        # 测试3: 作废未分发的激活码
-        try:
-            unused_code = await ActivationCode.filter(
-                status=ActivationCodeStatusEnum.UNUSED.code
-            ).first()
-            if unused_code:
-                request = ActivationCodeInvalidateRequest(activation_code=unused_code.activation_code)
-                await ActivationCodeService.invalidate_activation_code(request)
-                exception_tests.append({"test": "作废未分发激活码", "success": False, "reason": "应该抛出异常但没有"})
+        exception_tests = []
+        for (name, _, _), reason in zip(checks, reasons):
+            if reason is None:
+                exception_tests.append({"test": name, "success": True})
             else:
-                exception_tests.append({"test": "作废未分发激活码", "success": True, "reason": "没有未分发的激活码"})
-        except Exception:
-            exception_tests.append({"test": "作废未分发激活码", "success": True})
-
-        # 测试4: 激活不存在的激活码
-        try:
-            await ActivationCodeService.activate_activation_code("non_existent_code")
-            exception_tests.append({"test": "激活不存在激活码", "success": False, "reason": "应该抛出异常但没有"})
-        except Exception:
-            exception_tests.append({"test": "激活不存在激活码", "success": True})
+                exception_tests.append({"test": name, "success": False, "reason": reason})
+        if not unused_code:
+            for name in ("激活未分发激活码", "作废未分发激活码"):
+                exception_tests.append({"test": name, "success": True, "reason": "没有未分发的激活码"})
 
         # 统计异常测试结果
         success_count = sum(1 for test in exception_tests if test["success"])
@@ -367,40 +427,33 @@ class ActivationCodeTester:
 
     async def test_inventory_management(self):
         """测试库存管理功能"""
-        print("\n测试8: 库存管理功能")
+        self.output("\n测试8: 库存管理功能")
 
         try:
             # 获取各类型激活码的库存状态
             inventory_status = {}
 
-            for enum_type in ActivationTypeEnum:
-                unused_count = await ActivationCode.filter(
-                    type=enum_type.code,
-                    status=ActivationCodeStatusEnum.UNUSED.code
-                ).count()
-
-                distributed_count = await ActivationCode.filter(
-                    type=enum_type.code,
-                    status=ActivationCodeStatusEnum.DISTRIBUTED.code
-                ).count()
-
-                activated_count = await ActivationCode.filter(
-                    type=enum_type.code,
-                    status=ActivationCodeStatusEnum.ACTIVATED.code
-                ).count()
-
-                invalid_count = await ActivationCode.filter(
-                    type=enum_type.code,
-                    status=ActivationCodeStatusEnum.INVALID.code
-                ).count()
-
-                inventory_status[enum_type.desc] = {
-                    "unused": unused_count,
-                    "distributed": distributed_count,
-                    "activated": activated_count,
-                    "invalid": invalid_count,
-                    "total": unused_count + distributed_count + activated_count + invalid_count
+            # 一次 GROUP BY 查询统计所有类型、状态的数量
+            rows = await ActivationCode.all().annotate(
+                cnt=Count("id")
+            ).group_by("type", "status").order_by("type", "status").values("type", "status", "cnt")
+            counts = {(row["type"], row["status"]): row["cnt"] for row in rows}
+
+            # 统计项名称 -> 状态码，循环外解析一次
+            status_codes = {
+                "unused": STATUS_UNUSED,
+                "distributed": STATUS_DISTRIBUTED,
+                "activated": STATUS_ACTIVATED,
+                "invalid": STATUS_INVALID
+            }
+
+            for type_code, type_desc in ((t.code, t.desc) for t in ActivationTypeEnum):
+                type_counts = {
+                    name: counts.get((type_code, status), 0)
+                    for name, status in status_codes.items()
                 }
+                type_counts["total"] = sum(type_counts.values())
+                inventory_status[type_desc] = type_counts
 
             # 验证库存统计的准确性
             total_from_db = await ActivationCode.all().count()
@@ -435,10 +488,17 @@ class ActivationCodeTester:
             await self.test_activation_code_distribution()
             await self.test_activation_code_activation()
             await self.test_activation_code_invalidation()
-            await self.test_activation_code_query()
             await self.test_complete_business_flow()
-            await self.test_exception_scenarios()
-            await self.test_inventory_management()
+
+            # 以下测试只读数据、互不依赖，并发执行
+            # 各测试输出先写入缓冲区，结束后按测试依次打印，避免交错
+            outputs = await asyncio.gather(
+                self.run_buffered(self.test_activation_code_query),
+                self.run_buffered(self.test_exception_scenarios),
+                self.run_buffered(self.test_inventory_management)
+            )
+            for lines in outputs:
+                print("\n".join(lines))
 
             # 统计测试结果
             total_tests = len(self.test_results)
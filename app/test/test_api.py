@@ -4,19 +4,29 @@
 """
 
 import asyncio
+from contextvars import ContextVar
 from datetime import datetime, date, timedelta
+from typing import List, Optional
 
 import httpx
 
 # 配置
 BASE_URL = "http://127.0.0.1:8000/api"
 
+# 当前测试组的输出缓冲区；为 None 时直接打印（并发执行时每个组各自一份）
+_output_buffer: ContextVar[Optional[List[str]]] = ContextVar("_output_buffer", default=None)
+
 
 class APITestClient:
     """API 测试客户端"""
 
     def __init__(self):
-        self.client = httpx.AsyncClient(base_url=BASE_URL, timeout=30.0)
+        self.client = httpx.AsyncClient(
+            base_url=BASE_URL,
+            timeout=30.0,
+            # 放宽连接池与 keep-alive，并发执行各模块测试时复用连接
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=100, keepalive_expiry=15.0)
+        )
         self.token = None
         self.test_results = []
         # 测试过程中创建的数据ID，用于后续测试和清理
@@ -33,13 +43,33 @@ class APITestClient:
             return {"Authorization": f"Bearer {self.token}"}
         return {}
 
+    def output(self, text: str):
+        """输出测试信息，在 run_buffered 中执行时写入当前组的缓冲区"""
+        buffer = _output_buffer.get()
+        if buffer is None:
+            print(text)
+        else:
+            buffer.append(text)
+
     def log_test(self, name: str, success: bool, message: str = ""):
         status = "✓" if success else "✗"
-        print(f"  {status} {name}")
+        self.output(f"  {status} {name}")
         if message:
-            print(f"    {message}")
+            self.output(f"    {message}")
         self.test_results.append({"name": name, "success": success})
 
+    async def run_buffered(self, group) -> List[str]:
+        """执行一个测试组并返回它的全部输出，用于并发执行后按组依次打印"""
+        buffer: List[str] = []
+        # gather 为每个协程创建独立任务并复制上下文，这里的设置只影响当前组
+        _output_buffer.set(buffer)
+        try:
+            await group.run_all()
+        except Exception as e:
+            # 单个组异常不影响其他组输出
+            self.log_test(type(group).__name__, False, f"测试组执行异常: {e!r}")
+        return buffer
+
     async def get(self, path: str, **kwargs):
         return await self.client.get(path, headers=self._headers(), **kwargs)
 
@@ -69,7 +99,7 @@ class TestSystemCommon:
         self.client.log_test("GET /common/projects", success)
 
     async def run_all(self):
-        print("\n=== 系统-公共接口（2个） ===")
+        self.client.output("\n=== 系统-公共接口（2个） ===")
         await self.test_get_channels()
         await self.test_get_projects()
 
@@ -113,7 +143,7 @@ class TestAccountAuth:
         self.client.log_test("POST /auth/logout", success)
 
     async def run_all(self, username: str, password: str):
-        print("\n=== 账户-认证管理（4个） ===")
+        self.client.output("\n=== 账户-认证管理（4个） ===")
         await self.test_login(username, password)
         await self.test_get_profile()
         # 修改密码为相同密码（实际场景请修改）
@@ -162,7 +192,7 @@ class TestAccountUser:
         self.client.log_test("POST /users/pageList", success)
 
     async def run_all(self):
-        print("\n=== 账户-用户管理（4个） ===")
+        self.client.output("\n=== 账户-用户管理（4个） ===")
         # 注册需要有效激活码，这里跳过实际注册
         self.client.log_test("POST /users/register", True, "需要有效激活码")
         await self.test_get_user()
@@ -231,7 +261,7 @@ class TestAccountActivation:
         self.client.log_test("POST /activation/pageList", success)
 
     async def run_all(self):
-        print("\n=== 账户-激活码管理（6个） ===")
+        self.client.output("\n=== 账户-激活码管理（6个） ===")
         await self.test_init_codes()
         await self.test_distribute_codes()
         await self.test_activate_code()
@@ -280,7 +310,7 @@ class TestAccountSetting:
         self.client.log_test("GET /settings/group/{group_code}", success)
 
     async def run_all(self):
-        print("\n=== 账户-配置管理（5个） ===")
+        self.client.output("\n=== 账户-配置管理（5个） ===")
         await self.test_get_all_settings()
         await self.test_get_setting()
         await self.test_update_setting()
@@ -413,7 +443,7 @@ class TestAccountAccount:
             self.client.log_test("POST /accounts/delete", False, "无测试账号")
 
     async def run_all(self):
-        print("\n=== 账户-账号管理（11个） ===")
+        self.client.output("\n=== 账户-账号管理（11个） ===")
         await self.test_get_accounts()
         await self.test_create_account()
         await self.test_update_account()
@@ -499,7 +529,7 @@ class TestMonitorConfig:
             self.client.log_test("POST /monitor/config/delete", False, "无测试配置")
 
     async def run_all(self):
-        print("\n=== 监控-监控中心（6个） ===")
+        self.client.output("\n=== 监控-监控中心（6个） ===")
         await self.test_create_config()
         await self.test_get_config_list()
         await self.test_update_config()
@@ -521,7 +551,7 @@ class TestMonitorTask:
         self.client.log_test("POST /task/pageList", success)
 
     async def run_all(self):
-        print("\n=== 监控-任务管理（1个） ===")
+        self.client.output("\n=== 监控-任务管理（1个） ===")
         await self.test_get_task_list()
 
 
@@ -588,7 +618,7 @@ class TestMonitorBrowser:
         self.client.log_test("POST /browser/close-all", success)
 
     async def run_all(self):
-        print("\n=== 监控-浏览器管理（8个） ===")
+        self.client.output("\n=== 监控-浏览器管理（8个） ===")
         await self.test_health_check()
         await self.test_open_browser()
         await self.test_close_browser()
@@ -611,17 +641,25 @@ async def run_all_tests(username: str, password: str):
         # 系统模块（无需认证）
         await TestSystemCommon(client).run_all()
 
-        # 账户模块
+        # 账户模块（登录后才能访问其余接口）
         await TestAccountAuth(client).run_all(username, password)
-        await TestAccountUser(client).run_all()
-        await TestAccountActivation(client).run_all()
-        await TestAccountSetting(client).run_all()
-        await TestAccountAccount(client).run_all()
-
-        # 监控模块
-        await TestMonitorConfig(client).run_all()
-        await TestMonitorTask(client).run_all()
-        await TestMonitorBrowser(client).run_all()
+
+        # 登录后各模块之间没有数据依赖，并发执行；模块内部仍按顺序执行
+        groups = [
+            TestAccountUser(client),
+            TestAccountActivation(client),
+            TestAccountSetting(client),
+            TestAccountAccount(client),
+            # 监控模块
+            TestMonitorConfig(client),
+            TestMonitorTask(client),
+            TestMonitorBrowser(client)
+        ]
+        outputs = await asyncio.gather(*(client.run_buffered(group) for group in groups))
+
+        # 全部完成后按组依次打印标题和结果
+        for lines in outputs:
+            print("\n".join(lines))
 
         # 测试 logout（最后执行）
         print("\n=== 认证-注销 ===")
@@ -11,17 +11,17 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 from app.db.config import init_db, close_db
 from app.models.monitor.monitor_config import MonitorConfig
 from app.models.monitor.monitor_daily_stats import MonitorDailyStats
-from app.models.monitor_task import MonitorTask
+from app.models.monitor.task import Task
 from app.schemas.monitor.monitor import (
     MonitorConfigCreateRequest,
     MonitorConfigUpdateRequest,
     MonitorConfigToggleRequest,
     MonitorConfigQueryRequest,
-    MonitorDailyStatsQueryRequest,
-    MonitorTaskQueryRequest
+    MonitorDailyStatsQueryRequest
 )
-from app.services.monitor.monitor_service import MonitorService
-from app.services.monitor_task_service import MonitorTaskService
+from app.schemas.monitor.task import MonitorTaskQueryRequest
+from app.services.monitor.monitor_service import monitor_service
+from app.services.monitor.task_service import task_service
 from app.enums.common.channel import ChannelEnum
 from app.enums.monitor.task_type import TaskTypeEnum
 from app.enums.monitor.task_status import TaskStatusEnum
@@ -49,7 +49,7 @@ class MonitorTester:
         # 清理所有测试数据
         await MonitorConfig.all().delete()
         await MonitorDailyStats.all().delete()
-        await MonitorTask.all().delete()
+        await Task.all().delete()
         await close_db()
         print("测试数据库清理完成")
 
@@ -80,7 +80,7 @@ class MonitorTester:
                 target_url="https://www.douyin.com/user/test123"
             )
 
-            result = await MonitorService.create_monitor_config(self.test_user_id, request)
+            result = await monitor_service.create_monitor_config(self.test_user_id, request)
 
             # 验证结果
             assert result.user_id == self.test_user_id, "用户ID不匹配"
@@ -117,7 +117,7 @@ class MonitorTester:
                     channel_code=channel_code,
                     target_url=url
                 )
-                result = await MonitorService.create_monitor_config(self.test_user_id, request)
+                result = await monitor_service.create_monitor_config(self.test_user_id, request)
                 self.created_config_ids.append(result.id)
                 created_count += 1
 
@@ -138,7 +138,7 @@ class MonitorTester:
         try:
             # 测试基础分页查询
             params = MonitorConfigQueryRequest(page=1, size=10)
-            queryset = MonitorService.get_monitor_config_queryset(self.test_user_id, params)
+            queryset = monitor_service.get_monitor_config_queryset(self.test_user_id, params)
             results = await queryset
 
             assert len(results) > 0, "应该有配置记录"
@@ -149,7 +149,7 @@ class MonitorTester:
                 size=10,
                 channel_code=ChannelEnum.DOUYIN.code
             )
-            queryset_channel = MonitorService.get_monitor_config_queryset(self.test_user_id, params_channel)
+            queryset_channel = monitor_service.get_monitor_config_queryset(self.test_user_id, params_channel)
             results_channel = await queryset_channel
 
             for config in results_channel:
@@ -161,7 +161,7 @@ class MonitorTester:
                 size=10,
                 is_active=1
             )
-            queryset_active = MonitorService.get_monitor_config_queryset(self.test_user_id, params_active)
+            queryset_active = monitor_service.get_monitor_config_queryset(self.test_user_id, params_active)
             results_active = await queryset_active
 
             for config in results_active:
@@ -188,16 +188,11 @@ class MonitorTester:
             config_id = self.created_config_ids[0]
             new_url = "https://www.douyin.com/user/updated123"
 
-            request = MonitorConfigUpdateRequest(target_url=new_url)
-            result = await MonitorService.update_monitor_config(
-                self.test_user_id,
-                config_id,
-                request
-            )
+            request = MonitorConfigUpdateRequest(id=config_id, target_url=new_url)
+            result = await monitor_service.update_monitor_config(self.test_user_id, request)
 
             # 验证更新结果
-            assert result.id == config_id, "配置ID不匹配"
-            assert result.target_url == new_url, "链接未更新"
+            assert result is True, "修改失败"
 
             # 验证数据库中的更新
             updated_config = await MonitorConfig.get(id=config_id)
@@ -224,24 +219,20 @@ class MonitorTester:
             config_id = self.created_config_ids[0]
 
             # 禁用监控
-            disable_request = MonitorConfigToggleRequest(is_active=0)
-            result = await MonitorService.toggle_monitor_config(
-                self.test_user_id,
-                config_id,
-                disable_request
-            )
+            disable_request = MonitorConfigToggleRequest(id=config_id, is_active=0)
+            result = await monitor_service.toggle_monitor_config(self.test_user_id, disable_request)
 
-            assert result.is_active == 0, "禁用失败"
+            assert result is True, "禁用失败"
+            disabled_config = await MonitorConfig.get(id=config_id)
+            assert disabled_config.is_active == 0, "数据库状态未禁用"
 
             # 启用监控
-            enable_request = MonitorConfigToggleRequest(is_active=1)
-            result = await MonitorService.toggle_monitor_config(
-                self.test_user_id,
-                config_id,
-                enable_request
-            )
+            enable_request = MonitorConfigToggleRequest(id=config_id, is_active=1)
+            result = await monitor_service.toggle_monitor_config(self.test_user_id, enable_request)
 
-            assert result.is_active == 1, "启用失败"
+            assert result is True, "启用失败"
+            enabled_config = await MonitorConfig.get(id=config_id)
+            assert enabled_config.is_active == 1, "数据库状态未启用"
 
             self.log_test_result(
                 "切换监控状态",
@@ -264,7 +255,7 @@ class MonitorTester:
             config_id = self.created_config_ids[-1]
 
             # 执行软删除
-            result = await MonitorService.delete_monitor_config(
+            result = await monitor_service.delete_monitor_config(
                 self.test_user_id,
                 config_id
             )
@@ -277,7 +268,7 @@ class MonitorTester:
 
             # 验证查询时不包含已删除的配置
             params = MonitorConfigQueryRequest(page=1, size=100)
-            queryset = MonitorService.get_monitor_config_queryset(self.test_user_id, params)
+            queryset = monitor_service.get_monitor_config_queryset(self.test_user_id, params)
             results = await queryset
 
             for config in results:
@@ -327,7 +318,7 @@ class MonitorTester:
                 end_date=today
             )
 
-            results = await MonitorService.get_daily_stats(self.test_user_id, request)
+            results = await monitor_service.get_daily_stats(self.test_user_id, request)
 
             # 验证查询结果
             assert len(results) == 7, f"期望7条记录，实际{len(results)}条"
@@ -373,7 +364,7 @@ class MonitorTester:
 
             created_count = 0
             for task_data in tasks_data:
-                await MonitorTask.create(
+                await Task.create(
                     channel_code=task_data["channel_code"],
                     task_type=task_data["task_type"],
                     biz_id=config_id,
@@ -387,7 +378,7 @@ class MonitorTester:
 
             # 测试基础查询
             params = MonitorTaskQueryRequest(page=1, size=10)
-            queryset = MonitorTaskService.get_monitor_task_queryset(params)
+            queryset = task_service.get_monitor_task_queryset(params)
             results = await queryset
 
             assert len(results) >= created_count, f"期望至少{created_count}条记录"
@@ -398,7 +389,7 @@ class MonitorTester:
                 size=10,
                 channel_code=ChannelEnum.DOUYIN.code
             )
-            queryset_channel = MonitorTaskService.get_monitor_task_queryset(params_channel)
+            queryset_channel = task_service.get_monitor_task_queryset(params_channel)
             results_channel = await queryset_channel
 
             for task in results_channel:
@@ -410,7 +401,7 @@ class MonitorTester:
                 size=10,
                 task_type=TaskTypeEnum.DAILY_COLLECTION.code
             )
-            queryset_type = MonitorTaskService.get_monitor_task_queryset(params_type)
+            queryset_type = task_service.get_monitor_task_queryset(params_type)
             results_type = await queryset_type
 
             for task in results_type:
@@ -422,7 +413,7 @@ class MonitorTester:
                 size=10,
                 task_status=TaskStatusEnum.SUCCESS.code
             )
-            queryset_status = MonitorTaskService.get_monitor_task_queryset(params_status)
+            queryset_status = task_service.get_monitor_task_queryset(params_status)
             results_status = await queryset_status
 
             for task in results_status:
@@ -454,7 +445,7 @@ class MonitorTester:
                 channel_code=ChannelEnum.YOUTUBE.code,
                 target_url="https://www.youtube.com/@testflow"
             )
-            config = await MonitorService.create_monitor_config(self.test_user_id, create_request)
+            config = await monitor_service.create_monitor_config(self.test_user_id, create_request)
             flow_config_id = config.id
 
             # 2. 查询配置列表
@@ -463,20 +454,19 @@ class MonitorTester:
                 size=10,
                 channel_code=ChannelEnum.YOUTUBE.code
             )
-            queryset = MonitorService.get_monitor_config_queryset(self.test_user_id, query_params)
+            queryset = monitor_service.get_monitor_config_queryset(self.test_user_id, query_params)
             configs = await queryset
             assert any(c.id == flow_config_id for c in configs), "新建配置未出现在列表中"
 
             # 3. 修改配置
             update_request = MonitorConfigUpdateRequest(
+                id=flow_config_id,
                 target_url="https://www.youtube.com/@testflow_updated"
             )
-            updated_config = await MonitorService.update_monitor_config(
-                self.test_user_id,
-                flow_config_id,
-                update_request
-            )
-            assert updated_config.target_url == update_request.target_url, "配置未更新"
+            updated_config = await monitor_service.update_monitor_config(self.test_user_id, update_request)
+            assert updated_config is True, "修改失败"
+            flow_config = await MonitorConfig.get(id=flow_config_id)
+            assert flow_config.target_url == update_request.target_url, "配置未更新"
 
             # 4. 创建每日数据
             today = date.today()
@@ -496,11 +486,11 @@ class MonitorTester:
                 start_date=today - timedelta(days=2),
                 end_date=today
             )
-            stats = await MonitorService.get_daily_stats(self.test_user_id, stats_request)
+            stats = await monitor_service.get_daily_stats(self.test_user_id, stats_request)
             assert len(stats) == 3, "每日数据查询失败"
 
             # 6. 创建任务记录
-            await MonitorTask.create(
+            await Task.create(
                 channel_code=ChannelEnum.YOUTUBE.code,
                 task_type=TaskTypeEnum.DAILY_COLLECTION.code,
                 biz_id=flow_config_id,
@@ -510,16 +500,14 @@ class MonitorTester:
             )
 
             # 7. 禁用配置
-            toggle_request = MonitorConfigToggleRequest(is_active=0)
-            toggled_config = await MonitorService.toggle_monitor_config(
-                self.test_user_id,
-                flow_config_id,
-                toggle_request
-            )
-            assert toggled_config.is_active == 0, "禁用失败"
+            toggle_request = MonitorConfigToggleRequest(id=flow_config_id, is_active=0)
+            toggled_config = await monitor_service.toggle_monitor_config(self.test_user_id, toggle_request)
+            assert toggled_config is True, "禁用失败"
+            flow_config = await MonitorConfig.get(id=flow_config_id)
+            assert flow_config.is_active == 0, "数据库状态未禁用"
 
             # 8. 删除配置
-            delete_result = await MonitorService.delete_monitor_config(
+            delete_result = await monitor_service.delete_monitor_config(
                 self.test_user_id,
                 flow_config_id
             )
@@ -551,15 +539,15 @@ class MonitorTester:
 
         # 测试1: 修改不存在的配置
         try:
-            request = MonitorConfigUpdateRequest(target_url="https://test.com")
-            await MonitorService.update_monitor_config(self.test_user_id, 999999, request)
+            request = MonitorConfigUpdateRequest(id=999999, target_url="https://test.com")
+            await monitor_service.update_monitor_config(self.test_user_id, request)
             exception_tests.append({"test": "修改不存在的配置", "success": False, "reason": "应该抛出异常"})
         except Exception:
             exception_tests.append({"test": "修改不存在的配置", "success": True})
 
         # 测试2: 删除不存在的配置
         try:
-            await MonitorService.delete_monitor_config(self.test_user_id, 999999)
+            await monitor_service.delete_monitor_config(self.test_user_id, 999999)
             exception_tests.append({"test": "删除不存在的配置", "success": False, "reason": "应该抛出异常"})
         except Exception:
             exception_tests.append({"test": "删除不存在的配置", "success": True})
@@ -571,7 +559,7 @@ class MonitorTester:
                 start_date=date.today() - timedelta(days=7),
                 end_date=date.today()
             )
-            await MonitorService.get_daily_stats(self.test_user_id, request)
+            await monitor_service.get_daily_stats(self.test_user_id, request)
             exception_tests.append({"test": "查询不存在配置的数据", "success": False, "reason": "应该抛出异常"})
         except Exception:
             exception_tests.append({"test": "查询不存在配置的数据", "success": True})
@@ -590,8 +578,8 @@ class MonitorTester:
         # 测试5: 操作其他用户的配置
         try:
             if self.created_config_ids:
-                request = MonitorConfigUpdateRequest(target_url="https://hack.com")
-                await MonitorService.update_monitor_config(999, self.created_config_ids[0], request)
+                request = MonitorConfigUpdateRequest(id=self.created_config_ids[0], target_url="https://hack.com")
+                await monitor_service.update_monitor_config(999, request)
                 exception_tests.append({"test": "操作其他用户配置", "success": False, "reason": "应该抛出异常"})
             else:
                 exception_tests.append({"test": "操作其他用户配置", "success": True, "reason": "无配置可测试"})
@@ -627,13 +615,13 @@ class MonitorTester:
             # 统计任务状态分布
             task_status_stats = {}
             for status in TaskStatusEnum:
-                count = await MonitorTask.filter(task_status=status.code).count()
+                count = await Task.filter(task_status=status.code).count()
                 task_status_stats[status.desc] = count
 
             # 统计任务类型分布
             task_type_stats = {}
             for task_type in TaskTypeEnum:
-                count = await MonitorTask.filter(task_type=task_type.code).count()
+                count = await Task.filter(task_type=task_type.code).count()
                 task_type_stats[task_type.desc] = count
 
             # 统计每日数据记录数
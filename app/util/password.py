@@ -1,5 +1,12 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import bcrypt
 
+# bcrypt 为 CPU 密集型计算，放到独立线程池中执行，避免阻塞事件循环
+_PWD_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="pwd")
+
 
 def hash_password(password: str) -> str:
     """
@@ -27,3 +34,19 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
     # checkpw 会自动从哈希值中提取盐进行验证
     return bcrypt.checkpw(password_bytes, hashed_bytes)
+
+
+async def ahash_password(password: str) -> str:
+    """
+    异步哈希密码（在线程池中执行，不阻塞事件循环）。
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_PWD_POOL, hash_password, password)
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    异步验证密码（在线程池中执行，不阻塞事件循环）。
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_PWD_POOL, verify_password, plain_password, hashed_password)